@@ -8,9 +8,12 @@
 
   // ── State ──────────────────────────────────────────
   let allData = [];          // full dataset from JSON
-  let flatImages = [];       // [{src, date, idx}] for lightbox
+  let flatImages = [];       // [{image, key, date}] for lightbox
   let lightboxIndex = 0;
   let sortAsc = false;       // default: newest first
+  const bundleCache = new Map();   // bundle src -> Promise<Blob>, only if Range is ignored
+  const BUNDLE_CACHE_LIMIT = 2;    // whole bundles kept for slicing, oldest dropped first
+  const rangeProbes = new Map();   // bundle src -> first in-flight Promise<Response>
 
   // ── DOM refs ───────────────────────────────────────
   const gallery      = document.getElementById("gallery");
@@ -52,8 +55,8 @@
     flatImages = [];
     const data = sortAsc ? [...allData].reverse() : allData;
     data.forEach((entry) => {
-      entry.images.forEach((src) => {
-        flatImages.push({ src, date: entry.date });
+      entry.images.forEach((image) => {
+        flatImages.push({ image, key: imageKey(image), date: entry.date });
       });
     });
   }
@@ -101,9 +104,10 @@
       const layoutClass = count === 1 ? "layout-1" : count === 2 ? "layout-2" : count === 3 ? "layout-3" : "layout-many";
       grid.className = "photo-grid " + layoutClass;
 
-      entry.images.forEach((src, imgIdx) => {
-        const flatIdx = flatImages.findIndex((f) => f.src === src);
-        const card = buildCard(src, entry.date, flatIdx, count > 1 ? imgIdx + 1 : 0, count);
+      entry.images.forEach((image, imgIdx) => {
+        const key = imageKey(image);
+        const flatIdx = flatImages.findIndex((f) => f.key === key);
+        const card = buildCard(image, entry.date, flatIdx, count > 1 ? imgIdx + 1 : 0, count);
         grid.appendChild(card);
       });
 
@@ -114,7 +118,7 @@
   }
 
   // ── Build photo card ───────────────────────────────
-  function buildCard(src, date, flatIdx, imgNum, totalInDate) {
+  function buildCard(image, date, flatIdx, imgNum, totalInDate) {
     const card = document.createElement("div");
     card.className = "photo-card";
     card.setAttribute("role", "button");
@@ -122,7 +126,11 @@
     card.setAttribute("aria-label", "Open story from " + date);
 
     const img = document.createElement("img");
-    img.src = src;
+    if (typeof image === "string") {
+      img.src = image;
+    } else {
+      observeArchived(img, image);
+    }
     img.alt = "Instagram story — " + date;
     img.loading = "lazy";
     img.decoding = "async";
@@ -153,6 +161,87 @@
     return card;
   }
 
+  // ── Archived images ───────────────────────────────
+  // Closed months are packed by pack_archive.py into archive/YYYY-MM.bin;
+  // manifest entries then carry {src, offset, length, type} instead of a path.
+  function imageKey(image) {
+    return typeof image === "string" ? image : image.src + "#" + image.offset;
+  }
+
+  async function fetchRange(image) {
+    const end = image.offset + image.length - 1;
+
+    // Let the first request to a bundle finish its headers before sending more,
+    // so a server that ignores Range only ever streams the full bundle once.
+    const probe = rangeProbes.get(image.src);
+    if (probe) await probe.catch(() => {});
+
+    if (!bundleCache.has(image.src)) {
+      const req = fetch(image.src, { headers: { Range: "bytes=" + image.offset + "-" + end } });
+      if (!rangeProbes.has(image.src)) {
+        rangeProbes.set(image.src, req);
+        req.then((r) => { if (!r.ok) rangeProbes.delete(image.src); },
+                 () => rangeProbes.delete(image.src));
+      }
+      const res = await req;
+      if (!res.ok) throw new Error("HTTP " + res.status);
+      if (res.status === 206) {
+        return new Blob([await res.arrayBuffer()], { type: image.type });
+      }
+      // Server ignored the Range header and sent the whole bundle: keep it and slice locally.
+      if (bundleCache.has(image.src)) {
+        if (res.body) res.body.cancel();
+      } else {
+        bundleCache.set(image.src, res.blob().catch((err) => {
+          bundleCache.delete(image.src);
+          throw err;
+        }));
+        while (bundleCache.size > BUNDLE_CACHE_LIMIT) {
+          bundleCache.delete(bundleCache.keys().next().value);
+        }
+      }
+    }
+
+    const cached = bundleCache.get(image.src);
+    if (!cached) throw new Error("Could not load " + image.src);
+    const bundle = await cached;
+    return bundle.slice(image.offset, end + 1, image.type);
+  }
+
+  const archiveObserver = "IntersectionObserver" in window
+    ? new IntersectionObserver((entries) => {
+        entries.forEach((e) => {
+          if (!e.isIntersecting) return;
+          archiveObserver.unobserve(e.target);
+          showArchived(e.target, e.target._archived);
+        });
+      }, { rootMargin: "400px" })
+    : null;
+
+  function observeArchived(img, image) {
+    if (!archiveObserver) {
+      showArchived(img, image);
+      return;
+    }
+    img._archived = image;
+    archiveObserver.observe(img);
+  }
+
+  // Each <img> gets its own blob URL, revoked once it has loaded: the decoded
+  // picture stays on screen, but the Blob is not kept for the page's lifetime.
+  function showArchived(img, image, isCurrent) {
+    fetchRange(image)
+      .then((blob) => {
+        if (isCurrent && !isCurrent()) return;
+        const url = URL.createObjectURL(blob);
+        const release = () => URL.revokeObjectURL(url);
+        img.addEventListener("load", release, { once: true });
+        img.addEventListener("error", release, { once: true });
+        img.src = url;
+      })
+      .catch((err) => console.error(err));
+  }
+
   // ── Date formatter ─────────────────────────────────
   function formatDate(dateStr) {
     try {
@@ -205,7 +294,12 @@
 
   function updateLightboxImage() {
     const item = flatImages[lightboxIndex];
-    lightboxImg.src = item.src;
+    if (typeof item.image === "string") {
+      lightboxImg.src = item.image;
+    } else {
+      lightboxImg.removeAttribute("src");
+      showArchived(lightboxImg, item.image, () => flatImages[lightboxIndex] === item);
+    }
     lightboxImg.alt = "Story — " + item.date;
     lightboxCap.textContent = formatDate(item.date);
     lightboxCtr.textContent = (lightboxIndex + 1) + " / " + flatImages.length;
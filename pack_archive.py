@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Archive Packer for GMS Instagram Stories
+- Packs every closed month under pics/YYYY-MM-DD/ into archive/YYYY-MM.bin
+- Writes a byte-range index next to it as archive/YYYY-MM.json
+- Removes the packed loose files and regenerates gallery-data.json
+
+The bundle is a plain concatenation of the original image bytes, so the
+gallery can fetch a single story with an HTTP Range request. Late additions
+to an already packed month are appended to the end of its bundle.
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+from scan import ARCHIVE_DIR, PICS_DIR, SUPPORTED_EXTS, scan
+
+MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
+
+def parse_month(value):
+    """argparse type for --before: accept only YYYY-MM."""
+    try:
+        return datetime.strptime(value, "%Y-%m").strftime("%Y-%m")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM, got {value!r}")
+
+
+def closed_months(current_month):
+    """Group date directories by month, skipping the current (still open) one."""
+    months = {}
+
+    if not PICS_DIR.exists():
+        return months
+
+    for date_dir in sorted(PICS_DIR.iterdir()):
+        if not date_dir.is_dir():
+            continue
+        try:
+            datetime.strptime(date_dir.name, "%Y-%m-%d")
+        except ValueError:
+            print(f"[warn] Skipping {date_dir.name}/: not a YYYY-MM-DD directory")
+            continue
+        month = date_dir.name[:7]
+        if month < current_month:
+            months.setdefault(month, []).append(date_dir)
+
+    return months
+
+
+def load_index(month):
+    index_file = ARCHIVE_DIR / f"{month}.json"
+    if index_file.exists():
+        with open(index_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {"bundle": f"archive/{month}.bin", "images": []}
+
+
+def write_index(month, index):
+    """Write the index atomically so a crash never leaves it half-written."""
+    index_file = ARCHIVE_DIR / f"{month}.json"
+    tmp_file = index_file.with_suffix(".json.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, index_file)
+    fsync_dir(ARCHIVE_DIR)
+
+
+def fsync_dir(path):
+    """Persist directory entries (new bundle, renamed index). Not supported on Windows."""
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def read_packed(month, item):
+    with open(ARCHIVE_DIR / f"{month}.bin", "rb") as bundle:
+        bundle.seek(item["offset"])
+        return bundle.read(item["length"])
+
+
+def pack_month(month, date_dirs, dry_run=False):
+    """Append a month's loose images to its bundle. Returns the number of loose files handled."""
+    index = load_index(month)
+    known = {(item["date"], item["name"]): item for item in index["images"]}
+
+    pending = []
+    stale = []
+    for date_dir in date_dirs:
+        for f in sorted(date_dir.iterdir()):
+            if not f.is_file() or f.suffix.lower() not in SUPPORTED_EXTS:
+                continue
+            item = known.get((date_dir.name, f.name))
+            if item is None:
+                pending.append((date_dir.name, f))
+            elif f.read_bytes() == read_packed(month, item):
+                # Left behind by an interrupted run, or re-added after packing.
+                stale.append(f)
+            else:
+                raise RuntimeError(
+                    f"{date_dir.name}/{f.name} differs from the copy already in archive/{month}.bin; "
+                    "rename or remove it before packing"
+                )
+
+    if not pending and not stale:
+        return 0
+
+    if dry_run:
+        if pending:
+            print(f"[dry-run] Would pack {len(pending)} image(s) into archive/{month}.bin")
+        if stale:
+            print(f"[dry-run] Would remove {len(stale)} loose copy(ies) already in archive/{month}.bin")
+        return len(pending) + len(stale)
+
+    if pending:
+        append_to_bundle(month, index, pending)
+
+    # Only drop the loose copies once the bundle and its index are on disk.
+    for f in stale + [f for _, f in pending]:
+        f.unlink()
+    for date_dir in date_dirs:
+        keep = date_dir / ".gitkeep"
+        if keep.exists() and not any(p != keep for p in date_dir.iterdir()):
+            keep.unlink()
+        if not any(date_dir.iterdir()):
+            date_dir.rmdir()
+
+    if pending:
+        print(f"[ok] Packed {len(pending)} image(s) into archive/{month}.bin")
+    if stale:
+        print(f"[ok] Removed {len(stale)} loose copy(ies) already in archive/{month}.bin")
+    return len(pending) + len(stale)
+
+
+def append_to_bundle(month, index, pending):
+    ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+    bundle_file = ARCHIVE_DIR / f"{month}.bin"
+
+    with open(bundle_file, "ab") as bundle:
+        offset = bundle.tell()
+        for date_label, f in pending:
+            data = f.read_bytes()
+            bundle.write(data)
+            index["images"].append(
+                {
+                    "date": date_label,
+                    "name": f.name,
+                    "offset": offset,
+                    "length": len(data),
+                    "type": MIME_TYPES[f.suffix.lower()],
+                }
+            )
+            offset += len(data)
+        bundle.flush()
+        os.fsync(bundle.fileno())
+
+    index["images"].sort(key=lambda item: (item["date"], item["name"]))
+    write_index(month, index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack closed months of pics/ into archive bundles.")
+    parser.add_argument(
+        "--before",
+        metavar="YYYY-MM",
+        type=parse_month,
+        default=datetime.now().strftime("%Y-%m"),
+        help="pack months strictly before this one (default: current month)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="report what would be packed and exit")
+    args = parser.parse_args()
+    if args.before > datetime.now().strftime("%Y-%m"):
+        parser.error("--before cannot be later than the current month, which is still open")
+
+    total = 0
+    try:
+        for month, date_dirs in closed_months(args.before).items():
+            total += pack_month(month, date_dirs, dry_run=args.dry_run)
+    except RuntimeError as e:
+        print(f"[ERROR] {e}")
+        if total and not args.dry_run:
+            scan()
+        sys.exit(1)
+
+    if not total:
+        print("[info] Nothing to pack")
+        return
+
+    if not args.dry_run:
+        scan()
+
+
+if __name__ == "__main__":
+    main()
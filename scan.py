@@ -3,38 +3,76 @@ import json
 from pathlib import Path
 
 PICS_DIR = Path(__file__).parent / "pics"
+ARCHIVE_DIR = Path(__file__).parent / "archive"
 OUTPUT_FILE = Path(__file__).parent / "gallery-data.json"
 
 SUPPORTED_EXTS = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
 
 
+def load_archived():
+    """Read archive/*.json indexes into {date: [image ref, ...]}."""
+    archived = {}
+
+    if not ARCHIVE_DIR.exists():
+        return archived
+
+    for index_file in sorted(ARCHIVE_DIR.glob("*.json")):
+        with open(index_file, "r", encoding="utf-8") as f:
+            index = json.load(f)
+
+        for item in index["images"]:
+            archived.setdefault(item["date"], []).append(
+                {
+                    "src": index["bundle"],
+                    "name": item["name"],
+                    "offset": item["offset"],
+                    "length": item["length"],
+                    "type": item["type"],
+                }
+            )
+
+    return archived
+
+
 def scan():
     gallery = []
 
-    if not PICS_DIR.exists():
+    archived = load_archived()
+
+    if not PICS_DIR.exists() and not archived:
         print(f"[warn] pics/ directory not found at {PICS_DIR}")
         return
 
-    date_dirs = sorted(
-        [d for d in PICS_DIR.iterdir() if d.is_dir()],
-        reverse=True,
-    )
-
-    for date_dir in date_dirs:
-        date_label = date_dir.name
-        images = sorted(
-            [
-                f.name
-                for f in date_dir.iterdir()
-                if f.is_file() and f.suffix.lower() in SUPPORTED_EXTS
-            ]
-        )
+    archived_names = {date: {ref["name"] for ref in refs} for date, refs in archived.items()}
+
+    loose = {}
+    if PICS_DIR.exists():
+        for date_dir in PICS_DIR.iterdir():
+            if not date_dir.is_dir():
+                continue
+            loose[date_dir.name] = sorted(
+                [
+                    f.name
+                    for f in date_dir.iterdir()
+                    if f.is_file()
+                    and f.suffix.lower() in SUPPORTED_EXTS
+                    # Already packed; pack_archive.py removes these on its next run.
+                    and f.name not in archived_names.get(date_dir.name, set())
+                ]
+            )
+
+    for date_label in sorted(set(loose) | set(archived), reverse=True):
+        # Archived refs and loose paths share one filename order, as before packing.
+        named = [(ref["name"], ref) for ref in archived.get(date_label, [])] + [
+            (img, f"pics/{date_label}/{img}") for img in loose.get(date_label, [])
+        ]
+        images = [image for _, image in sorted(named, key=lambda pair: pair[0])]
 
         if images:
             gallery.append(
                 {
                     "date": date_label,
-                    "images": [f"pics/{date_label}/{img}" for img in images],
+                    "images": images,
                 }
             )
 